@@ -7,6 +7,13 @@
 # ============================================================================
 
 # Import required libraries
+import functools  # For wrapping the generator with the cache decorator
+import hashlib  # For hashing CAPTCHA text into cache keys
+import multiprocessing  # For rendering CAPTCHA batches on all CPU cores
+import os  # For atomic file replacement and cache directory management
+import tempfile  # For writing cache entries via temporary files
+from io import BytesIO  # For holding the rendered image in memory
+from typing import Callable, List, Optional  # For type hints and annotations
 from captcha.image import ImageCaptcha  # For generating CAPTCHA images
 
 
@@ -17,15 +24,25 @@ from captcha.image import ImageCaptcha  # For generating CAPTCHA images
 CAPTCHA_WIDTH = 300   # Image width in pixels
 CAPTCHA_HEIGHT = 100  # Image height in pixels
 OUTPUT_FILENAME = 'CAPTCHA1.png'  # Default output file name
+WRITE_BUFFER_SIZE = 64 * 1024  # File write buffer size in bytes (64 KiB)
+PNG_COMPRESS_LEVEL = 1  # zlib level 0-9; CAPTCHAs are short-lived, favour speed
+
+# Define on-disk cache settings for previously rendered CAPTCHAs
+CACHE_DIR = '.captcha_cache'  # Directory holding cached PNG files
+CACHE_MAX_ENTRIES = 100  # Least recently used files are evicted beyond this
 
 
 # ============================================================================
 # CAPTCHA GENERATOR SETUP
 # ============================================================================
+@functools.lru_cache(maxsize=None)
 def create_captcha_generator() -> ImageCaptcha:
     """
     Creates and configures a CAPTCHA image generator with specified dimensions.
 
+    The generator is created once per process and shared by later calls,
+    so its TrueType fonts are parsed only once.
+
     Returns:
         ImageCaptcha: Configured CAPTCHA generator instance with predefined size.
     """
@@ -34,6 +51,12 @@ def create_captcha_generator() -> ImageCaptcha:
     # Width and height determine the size of the generated CAPTCHA image
     image_generator = ImageCaptcha(width=CAPTCHA_WIDTH, height=CAPTCHA_HEIGHT)
 
+    # FONT PRELOADING
+    # ImageCaptcha parses every font/size pair the first time its truefonts
+    # property is read and keeps them; reading it here moves that cost out
+    # of the first render
+    _ = image_generator.truefonts
+
     return image_generator
 
 
@@ -59,10 +82,126 @@ def get_captcha_text() -> str:
     return captcha_text
 
 
+# ============================================================================
+# PNG ENCODING
+# ============================================================================
+def render_captcha_png(generator: ImageCaptcha, text: str) -> BytesIO:
+    """
+    Renders a CAPTCHA and encodes it as a PNG using fast compression.
+
+    Args:
+        generator (ImageCaptcha): The configured CAPTCHA generator instance.
+        text (str): The text to be rendered as a CAPTCHA image.
+
+    Returns:
+        BytesIO: In-memory buffer holding the encoded PNG image.
+    """
+    # IMAGE RENDERING
+    image = generator.generate_image(text)
+
+    # PNG ENCODING
+    # Deflate dominates PNG encoding time at the default level 6
+    image_data = BytesIO()
+    image.save(image_data, format='PNG', compress_level=PNG_COMPRESS_LEVEL)
+    image_data.seek(0)
+
+    return image_data
+
+
+# ============================================================================
+# CAPTCHA IMAGE CACHING
+# ============================================================================
+def _cache_path(text: str) -> str:
+    """
+    Builds the cache file path for the given CAPTCHA text.
+
+    Args:
+        text (str): The text rendered in the CAPTCHA image.
+
+    Returns:
+        str: Path of the cached PNG file for this text and image size.
+    """
+    # CACHE KEY GENERATION
+    # Include the image dimensions so resized CAPTCHAs never collide
+    key_source = f"{CAPTCHA_WIDTH}x{CAPTCHA_HEIGHT}\x00{text}".encode()
+    cache_key = hashlib.blake2b(key_source, digest_size=16).hexdigest()
+
+    return os.path.join(CACHE_DIR, f"{cache_key}.png")
+
+
+def _evict_old_entries() -> None:
+    """
+    Removes the least recently used cache files once CACHE_MAX_ENTRIES is exceeded.
+    """
+    # CACHE INVENTORY
+    # Sort cached files by modification time, most recently used last
+    entries = [os.path.join(CACHE_DIR, name) for name in os.listdir(CACHE_DIR)
+               if name.endswith('.png')]
+    entries.sort(key=os.path.getmtime)
+
+    # LRU EVICTION
+    for path in entries[:max(0, len(entries) - CACHE_MAX_ENTRIES)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def cache_captcha_image(func: Callable[[ImageCaptcha, str], BytesIO]) -> Callable[[ImageCaptcha, str], BytesIO]:
+    """
+    Decorator that caches rendered CAPTCHA images on disk, keyed by text hash.
+
+    Note that a cache hit returns the exact same image for the same text,
+    which trades CAPTCHA variety for speed in demo and testing workflows.
+
+    Args:
+        func (Callable): The CAPTCHA generation function to wrap.
+
+    Returns:
+        Callable: Wrapped function returning cached image data when available.
+    """
+    @functools.wraps(func)
+    def wrapper(generator: ImageCaptcha, text: str) -> BytesIO:
+        cache_path = _cache_path(text)
+
+        # CACHE HIT
+        # Reuse the stored PNG and refresh its timestamp for LRU ordering
+        try:
+            with open(cache_path, 'rb') as cached_file:
+                image_data = BytesIO(cached_file.read())
+            os.utime(cache_path)
+            return image_data
+        except OSError:
+            pass
+
+        # CACHE MISS
+        # Render the image, then store it atomically via a temporary file
+        image_data = func(generator, text)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE) as temp_file:
+                    temp_file.write(image_data.getbuffer())
+                os.replace(temp_path, cache_path)
+            except OSError:
+                os.remove(temp_path)
+                raise
+            _evict_old_entries()
+        except OSError as e:
+            # A failing cache must never prevent CAPTCHA generation
+            print(f"Warning: could not cache CAPTCHA image: {e}")
+
+        return image_data
+
+    return wrapper
+
+
 # ============================================================================
 # CAPTCHA IMAGE GENERATION
 # ============================================================================
-def generate_captcha_image(generator: ImageCaptcha, text: str) -> bytes:
+@cache_captcha_image
+def generate_captcha_image(generator: ImageCaptcha, text: str) -> BytesIO:
     """
     Generates CAPTCHA image data from the provided text.
 
@@ -71,27 +210,73 @@ def generate_captcha_image(generator: ImageCaptcha, text: str) -> bytes:
         text (str): The text to be rendered as a CAPTCHA image.
 
     Returns:
-        bytes: The generated image data in binary format.
+        BytesIO: In-memory buffer holding the encoded PNG image.
     """
     # IMAGE DATA GENERATION
-    # Generate the CAPTCHA image as binary data
+    # Generate the CAPTCHA image as an in-memory PNG buffer
     # The generator applies distortion, styling, and visual effects
     # to make the text challenging for automated systems to read
-    image_data = generator.generate(text)
+    # (the warping runs in Pillow's C transforms, not in Python loops)
+    image_data = render_captcha_png(generator, text)
 
     return image_data
 
 
+# ============================================================================
+# BATCH CAPTCHA GENERATION
+# ============================================================================
+# Generator owned by each worker process, created once by _init_worker
+_worker_generator: Optional[ImageCaptcha] = None
+
+
+def _init_worker() -> None:
+    """
+    Creates the CAPTCHA generator of a worker process so fonts load only once.
+    """
+    global _worker_generator
+    _worker_generator = create_captcha_generator()
+
+
+def _render_one(text: str) -> bytes:
+    """
+    Renders a single CAPTCHA with the worker's generator.
+
+    Args:
+        text (str): The text to be rendered as a CAPTCHA image.
+
+    Returns:
+        bytes: The encoded PNG image data.
+    """
+    return render_captcha_png(_worker_generator, text).getvalue()
+
+
+def generate_many(texts: List[str]) -> List[bytes]:
+    """
+    Generates CAPTCHA images for many texts in parallel across CPU cores.
+
+    Rendering is CPU-bound, so worker processes are used instead of threads.
+
+    Args:
+        texts (List[str]): The texts to be rendered as CAPTCHA images.
+
+    Returns:
+        List[bytes]: Encoded PNG image data for each text, in input order.
+    """
+    # PARALLEL RENDERING
+    # One worker per CPU core, each with its own ImageCaptcha instance
+    with multiprocessing.Pool(initializer=_init_worker) as pool:
+        return pool.map(_render_one, texts)
+
+
 # ============================================================================
 # FILE OPERATIONS - SAVE FUNCTIONALITY
 # ============================================================================
-def save_captcha_image(generator: ImageCaptcha, text: str, filename: str) -> None:
+def save_captcha_image(image_data: BytesIO, filename: str) -> None:
     """
-    Saves the generated CAPTCHA image to a file on disk.
+    Saves already generated CAPTCHA image data to a file on disk.
 
     Args:
-        generator (ImageCaptcha): The configured CAPTCHA generator instance.
-        text (str): The text used to generate the CAPTCHA.
+        image_data (BytesIO): The encoded image returned by generate_captcha_image.
         filename (str): The filename where the image will be saved.
 
     Raises:
@@ -99,9 +284,10 @@ def save_captcha_image(generator: ImageCaptcha, text: str, filename: str) -> Non
     """
     try:
         # FILE WRITING OPERATION
-        # Write the CAPTCHA image directly to file
-        # The generator handles image encoding and file format
-        generator.write(text, filename)
+        # Write the existing PNG bytes through a 64 KiB buffer
+        # Reusing the buffer avoids rendering the CAPTCHA a second time
+        with open(filename, 'wb', buffering=WRITE_BUFFER_SIZE) as image_file:
+            image_file.write(image_data.getbuffer())
 
         # SUCCESS CONFIRMATION
         print(f"CAPTCHA image saved successfully as: {filename}")
@@ -175,7 +361,7 @@ def main() -> None:
 
         # FILE SAVING OPERATION
         # Save the generated CAPTCHA image to disk
-        save_captcha_image(captcha_generator, user_text, OUTPUT_FILENAME)
+        save_captcha_image(image_data, OUTPUT_FILENAME)
 
         # IMAGE DISPLAY
         # Open the saved image for immediate viewing
@@ -9,8 +9,16 @@
 
 # Import required libraries
 from ipwhois import IPWhois  # For WHOIS data retrieval and RDAP lookups
-import re  # For IP address validation using regular expressions
-from typing import Dict, List, Optional, Any  # For type hints and annotations
+try:
+    import httpx  # For pooled HTTP/2 RDAP requests (pip install "httpx[http2]")
+except ImportError:
+    httpx = None  # Batch lookups fall back to ipwhois
+import asyncio  # For running batch lookups concurrently
+import ipaddress  # For matching IP addresses against bootstrap prefixes
+import re  # For fallback IP address validation using regular expressions
+import socket  # For IP address validation via the C-level inet_pton parser
+from concurrent.futures import ThreadPoolExecutor  # For parallel ipwhois fallback lookups
+from typing import Dict, List, Optional, Any, Tuple  # For type hints and annotations
 
 # ============================================================================
 # CONFIGURATION CONSTANTS
@@ -19,6 +27,31 @@ from typing import Dict, List, Optional, Any  # For type hints and annotations
 SEPARATOR_LINE = "-" * 50
 SECTION_HEADER = "=" * 60
 
+# Define batch processing settings
+# IANA bootstrap files map IP prefixes to the RDAP server of each registry
+RDAP_BOOTSTRAP_URLS = (
+    'https://data.iana.org/rdap/ipv4.json',
+    'https://data.iana.org/rdap/ipv6.json'
+)
+RDAP_REQUEST_TIMEOUT = 10  # Seconds to wait for an RDAP response
+MAX_CONCURRENT_RDAP_QUERIES = 8  # In-flight RDAP queries, to avoid throttling
+
+# Errors that make the async batch path unusable as a whole
+# (bootstrap download failures or malformed bootstrap JSON)
+_BOOTSTRAP_ERRORS = (ValueError, KeyError) + ((httpx.HTTPError,) if httpx else ())
+
+# Bootstrap registry, fetched once and reused by later batches
+# Entries are (network, base_url) sorted from longest to shortest prefix
+_rdap_registry: Optional[List[Tuple[Any, str]]] = None
+
+# Define fallback IP validation patterns, compiled once at module load
+# Only used on platforms where socket.inet_pton is unavailable
+# IPv4: xxx.xxx.xxx.xxx where xxx is 0-255
+_IPV4_RE = re.compile(r'(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)')
+# IPv6 (simplified): eight hexadecimal groups, or the '::1' and '::' shorthands
+_IPV6_RE = re.compile(r'(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}|::1|::')
+_HAS_INET_PTON = hasattr(socket, 'inet_pton')
+
 # Define WHOIS data field mappings for display
 WHOIS_DISPLAY_FIELDS = {
     'cidr': 'Net Range',
@@ -43,18 +76,22 @@ def validate_ip_address(ip_address: str) -> bool:
     Returns:
         bool: True if the IP address is valid, False otherwise.
     """
-    # IPv4 VALIDATION PATTERN
-    # Matches standard IPv4 format: xxx.xxx.xxx.xxx where xxx is 0-255
-    ipv4_pattern = r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-
-    # IPv6 VALIDATION PATTERN (simplified)
-    # Matches basic IPv6 format with hexadecimal groups separated by colons
-    ipv6_pattern = r'^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$|^::1$|^::$'
+    cleaned_ip = ip_address.strip()
 
-    # VALIDATION CHECK
-    # Test against both IPv4 and IPv6 patterns
-    if re.match(ipv4_pattern, ip_address.strip()) or re.match(ipv6_pattern, ip_address.strip()):
-        return True
+    # REGEX FALLBACK
+    # fullmatch needs no ^...$ anchors and stops at the first mismatch
+    if not _HAS_INET_PTON:
+        return bool(_IPV4_RE.fullmatch(cleaned_ip) or _IPV6_RE.fullmatch(cleaned_ip))
+
+    # ADDRESS PARSING
+    # inet_pton accepts every valid textual form, including compressed IPv6
+    # such as '2001:db8::1', and raises for anything else
+    for address_family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(address_family, cleaned_ip)
+            return True
+        except (OSError, ValueError):
+            continue
 
     return False
 
@@ -76,6 +113,11 @@ def extract_network_info(whois_data: Dict[str, Any]) -> Dict[str, str]:
     # Extract network section from WHOIS response
     network_data = whois_data.get('network', {})
 
+    # DESCRIPTION EXTRACTION
+    # Use the first remark's description, looking 'remarks' up only once
+    remarks = network_data.get('remarks')
+    description = remarks[0].get('description', 'N/A') if remarks else 'N/A'
+
     # INFORMATION FORMATTING
     # Create clean, formatted output for display
     formatted_info = {
@@ -84,8 +126,7 @@ def extract_network_info(whois_data: Dict[str, Any]) -> Dict[str, str]:
         'country': network_data.get('country', 'N/A'),
         'created': network_data.get('created', 'N/A'),
         'updated': network_data.get('updated', 'N/A'),
-        'description': network_data.get('remarks', [{}])[0].get('description', 'N/A') if network_data.get(
-            'remarks') else 'N/A'
+        'description': description
     }
 
     return formatted_info
@@ -94,18 +135,16 @@ def extract_network_info(whois_data: Dict[str, Any]) -> Dict[str, str]:
 # ============================================================================
 # WHOIS LOOKUP FUNCTIONALITY
 # ============================================================================
-def perform_whois_lookup(ip_address: str) -> Optional[Dict[str, Any]]:
+def lookup_whois_data(ip_address: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
     """
-    Performs RDAP-based WHOIS lookup for the specified IP address.
+    Performs RDAP-based WHOIS lookup and reports why it failed instead of printing.
 
     Args:
         ip_address (str): The IP address to query for WHOIS information.
 
     Returns:
-        Optional[Dict[str, Any]]: WHOIS data dictionary if successful, None if failed.
-
-    Raises:
-        Exception: Various exceptions related to network connectivity or invalid IP.
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: WHOIS data dictionary and None
+        if successful, None and the failure reason if failed.
     """
     try:
         # WHOIS OBJECT INITIALIZATION
@@ -118,18 +157,32 @@ def perform_whois_lookup(ip_address: str) -> Optional[Dict[str, Any]]:
         # Provides structured JSON data instead of plain text
         whois_data = whois_obj.lookup_rdap()
 
-        return whois_data
+        return whois_data, None
 
     # SPECIFIC ERROR HANDLING
     except ConnectionError as e:
-        print(f"Network connection error for {ip_address}: {e}")
-        return None
+        return None, f"Network connection error for {ip_address}: {e}"
     except ValueError as e:
-        print(f"Invalid IP address format {ip_address}: {e}")
-        return None
+        return None, f"Invalid IP address format {ip_address}: {e}"
     except Exception as e:
-        print(f"Unexpected error during WHOIS lookup for {ip_address}: {e}")
-        return None
+        return None, f"Unexpected error during WHOIS lookup for {ip_address}: {e}"
+
+
+def perform_whois_lookup(ip_address: str) -> Optional[Dict[str, Any]]:
+    """
+    Performs RDAP-based WHOIS lookup for the specified IP address.
+
+    Args:
+        ip_address (str): The IP address to query for WHOIS information.
+
+    Returns:
+        Optional[Dict[str, Any]]: WHOIS data dictionary if successful, None if failed.
+    """
+    whois_data, error = lookup_whois_data(ip_address)
+    if error is not None:
+        print(error)
+
+    return whois_data
 
 
 # ============================================================================
@@ -198,6 +251,178 @@ def get_whois_info(ip_address: str) -> Optional[Dict[str, str]]:
     return network_info
 
 
+# ============================================================================
+# ASYNC RDAP CLIENT
+# ============================================================================
+async def fetch_rdap_bootstrap(client: 'httpx.AsyncClient') -> List[Tuple[Any, str]]:
+    """
+    Downloads the IANA RDAP bootstrap files and builds a prefix registry.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client used for the requests.
+
+    Returns:
+        List[Tuple[Any, str]]: (network, base_url) pairs, longest prefix first.
+    """
+    # BOOTSTRAP DOWNLOAD
+    # Fetch the IPv4 and IPv6 bootstrap files concurrently
+    responses = await asyncio.gather(*(client.get(url) for url in RDAP_BOOTSTRAP_URLS))
+
+    # REGISTRY CONSTRUCTION
+    # Each service entry is [[prefixes...], [base URLs...]]; prefer HTTPS URLs
+    registry = []
+    for response in responses:
+        response.raise_for_status()
+        for prefixes, urls in response.json()['services']:
+            base_url = next((url for url in urls if url.startswith('https://')), urls[0])
+            for prefix in prefixes:
+                registry.append((ipaddress.ip_network(prefix), base_url))
+
+    # Longest prefixes first, so the first match is the most specific one
+    registry.sort(key=lambda entry: entry[0].prefixlen, reverse=True)
+
+    return registry
+
+
+def find_rdap_server(ip_address: str, registry: List[Tuple[Any, str]]) -> Optional[str]:
+    """
+    Finds the RDAP base URL responsible for an IP address (longest prefix match).
+
+    Args:
+        ip_address (str): The IP address to look up.
+        registry (List[Tuple[Any, str]]): Registry built by fetch_rdap_bootstrap.
+
+    Returns:
+        Optional[str]: Base URL of the registry's RDAP service, None if unknown.
+    """
+    address = ipaddress.ip_address(ip_address)
+    for network, base_url in registry:
+        if network.version == address.version and address in network:
+            return base_url
+
+    return None
+
+
+def parse_rdap_network(rdap_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converts a raw RDAP IP network response into the ipwhois 'network' layout.
+
+    Args:
+        rdap_data (Dict[str, Any]): JSON body returned by an RDAP server.
+
+    Returns:
+        Dict[str, Any]: Network data with the keys used by extract_network_info.
+    """
+    # CIDR FORMATTING
+    # The cidr0 extension lists the blocks; otherwise fall back to the range
+    cidrs = [f"{block.get('v4prefix') or block.get('v6prefix')}/{block.get('length')}"
+             for block in rdap_data.get('cidr0_cidrs', [])]
+    if cidrs:
+        cidr = ', '.join(cidrs)
+    else:
+        cidr = f"{rdap_data.get('startAddress', 'N/A')} - {rdap_data.get('endAddress', 'N/A')}"
+
+    # EVENT DATES
+    # Registration and last change dates are reported as events
+    events = {event.get('eventAction'): event.get('eventDate')
+              for event in rdap_data.get('events', [])}
+
+    # REMARKS
+    # RDAP remark descriptions are lists of lines; join them like ipwhois does
+    remarks = [{'title': remark.get('title'),
+                'description': '\n'.join(remark.get('description', []))}
+               for remark in rdap_data.get('remarks', [])]
+
+    return {
+        'cidr': cidr,
+        'name': rdap_data.get('name'),
+        'country': rdap_data.get('country'),
+        'created': events.get('registration'),
+        'updated': events.get('last changed'),
+        'remarks': remarks or None
+    }
+
+
+async def perform_rdap_lookup_async(client: 'httpx.AsyncClient', registry: List[Tuple[Any, str]],
+                                    ip_address: str, query_slots: asyncio.Semaphore
+                                    ) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Performs an RDAP lookup over the shared client for a single IP address.
+
+    Args:
+        client (httpx.AsyncClient): Shared HTTP client with a connection pool.
+        registry (List[Tuple[Any, str]]): Registry built by fetch_rdap_bootstrap.
+        ip_address (str): The IP address to query.
+        query_slots (asyncio.Semaphore): Limits the number of in-flight queries.
+
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: WHOIS data dictionary and None
+        if successful, None and the failure reason if failed. Reasons are returned
+        rather than printed so they appear next to their IP in the ordered output.
+    """
+    try:
+        # RDAP SERVER RESOLUTION
+        base_url = find_rdap_server(ip_address, registry)
+        if base_url is None:
+            return None, f"No RDAP server registered for {ip_address}"
+
+        # RDAP QUERY EXECUTION
+        # Requests to the same registry reuse one multiplexed HTTP/2 connection
+        async with query_slots:
+            response = await client.get(f"{base_url.rstrip('/')}/ip/{ip_address}")
+        response.raise_for_status()
+
+        return {'network': parse_rdap_network(response.json())}, None
+
+    # SPECIFIC ERROR HANDLING
+    except httpx.HTTPStatusError as e:
+        return None, f"RDAP server returned HTTP {e.response.status_code} for {ip_address}"
+    except httpx.HTTPError as e:
+        return None, f"Network connection error for {ip_address}: {e}"
+    except ValueError as e:
+        return None, f"Invalid RDAP response for {ip_address}: {e}"
+    except Exception as e:
+        return None, f"Unexpected error during WHOIS lookup for {ip_address}: {e}"
+
+
+async def lookup_ip_batch(ip_addresses: List[str]
+                          ) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Looks up several IP addresses concurrently over a single HTTP client.
+
+    Args:
+        ip_addresses (List[str]): Validated IP addresses to query.
+
+    Returns:
+        List[Tuple[Optional[Dict[str, Any]], Optional[str]]]: WHOIS data and failure
+        reason for each address, in input order.
+
+    Raises:
+        ImportError: If httpx, or the h2 package needed for HTTP/2, is missing.
+    """
+    global _rdap_registry
+
+    # Nothing to look up, so skip the client and the bootstrap download
+    if not ip_addresses:
+        return []
+
+    if httpx is None:
+        raise ImportError("httpx is not installed")
+
+    query_slots = asyncio.Semaphore(MAX_CONCURRENT_RDAP_QUERIES)
+    async with httpx.AsyncClient(http2=True, timeout=RDAP_REQUEST_TIMEOUT,
+                                 follow_redirects=True) as client:
+        # BOOTSTRAP LOADING
+        # Only the first batch downloads the IANA bootstrap files
+        if _rdap_registry is None:
+            _rdap_registry = await fetch_rdap_bootstrap(client)
+
+        return await asyncio.gather(*(
+            perform_rdap_lookup_async(client, _rdap_registry, ip_address, query_slots)
+            for ip_address in ip_addresses
+        ))
+
+
 # ============================================================================
 # BATCH PROCESSING FUNCTIONALITY
 # ============================================================================
@@ -219,13 +444,47 @@ def process_ip_list(ip_addresses: List[str]) -> Dict[str, Optional[Dict[str, str
     print(f"PROCESSING {len(ip_addresses)} IP ADDRESSES")
     print(f"{SECTION_HEADER}")
 
-    # SEQUENTIAL PROCESSING
-    # Process each IP address in the provided list
+    # INPUT VALIDATION
+    # Only well-formed addresses are sent to the RDAP servers
+    valid_ips = [ip_address.strip() for ip_address in ip_addresses
+                 if validate_ip_address(ip_address)]
+
+    # CONCURRENT LOOKUPS
+    # All queries run on one event loop and share a single connection pool
+    try:
+        batch_data = asyncio.run(lookup_ip_batch(valid_ips))
+    except ImportError as e:
+        print(f"Async RDAP client unavailable ({e}), using ipwhois instead")
+        batch_data = None
+    except _BOOTSTRAP_ERRORS as e:
+        print(f"Failed to load RDAP bootstrap data ({e}), using ipwhois instead")
+        batch_data = None
+
+    # THREADED FALLBACK
+    # Query the addresses through ipwhois in parallel when the async path is
+    # unavailable; executor.map returns the results in input order
+    if batch_data is None:
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_RDAP_QUERIES) as executor:
+            batch_data = list(executor.map(lookup_whois_data, valid_ips))
+    whois_by_ip = dict(zip(valid_ips, batch_data))
+
+    # RESULTS PROCESSING
+    # Display results in input order once every lookup has finished
     for index, ip_address in enumerate(ip_addresses, 1):
         print(f"\nProcessing IP {index}/{len(ip_addresses)}: {ip_address}")
 
-        # INDIVIDUAL LOOKUP
-        whois_info = get_whois_info(ip_address)
+        cleaned_ip = ip_address.strip()
+        whois_info = None
+        if cleaned_ip not in whois_by_ip:
+            print(f"Error: Invalid IP address format: {ip_address}")
+        else:
+            whois_data, error = whois_by_ip[cleaned_ip]
+            if whois_data is None:
+                print(error)
+                print(f"Failed to retrieve WHOIS information for: {ip_address}")
+            else:
+                whois_info = extract_network_info(whois_data)
+                display_whois_results(cleaned_ip, whois_info)
         results[ip_address] = whois_info
 
         # PROGRESS INDICATION
@@ -2,29 +2,202 @@
 # MULTILINGUAL TEXT TO SPEECH WITH gTTS
 # ============================================================================
 # Uses Google Text-to-Speech (gTTS) with support for 100+ languages
-# Requires: pip install gtts pygame
+# Requires: pip install "gtts>=2.3" "pygame>=2"
 # Note: Requires internet connection for gTTS to work
 # ============================================================================
 
+import hashlib
 import io
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from gtts import gTTS
 from gtts.lang import tts_langs
 import pygame
 import sys
 
+# Synthesized MP3s are cached here, so repeated phrases skip the network
+CACHE_DIR = Path.home() / '.cache' / 'tts'
+
+# gTTS produces 24 kHz audio, so the mixer is opened at the same rate
+MIXER_FREQUENCY = 24000
+MUSIC_END_EVENT = pygame.USEREVENT
+
+# Set once the pygame audio output has been opened
+_MIXER_READY = False
+
+# Supported languages, loaded on first use
+_LANGS = None
+
+# Decoded demo sounds keyed by (lang, text), so replays skip MP3 decoding
+_SOUND_CACHE = {}
+
+
+def get_languages():
+    """
+    Get the languages supported by gTTS, fetching them only once
+
+    Returns:
+        dict: Language codes mapped to language names
+    """
+    global _LANGS
+    if _LANGS is None:
+        _LANGS = tts_langs()
+    return _LANGS
+
+
+def init_audio():
+    """
+    Initialize pygame audio playback once and reuse it for every phrase
+    """
+    global _MIXER_READY
+    if _MIXER_READY:
+        return
+
+    pygame.mixer.init(frequency=MIXER_FREQUENCY)
+
+    # The event queue needs the display module (no window is opened);
+    # without a video driver, playback falls back to polling
+    try:
+        pygame.display.init()
+    except pygame.error:
+        pass
+    pygame.mixer.music.set_endevent(MUSIC_END_EVENT)
+
+    _MIXER_READY = True
+
+
+def play_audio(fp):
+    """
+    Play an MP3 file object and block until playback has finished
+
+    Args:
+        fp (file object): MP3 audio to play
+    """
+    init_audio()
+
+    # Load and play the audio
+    pygame.mixer.music.load(fp)
+    if pygame.display.get_init():
+        pygame.event.clear(MUSIC_END_EVENT)
+    pygame.mixer.music.play()
+
+    # Wait for playback to finish, sleeping until the end event arrives
+    if pygame.display.get_init():
+        while pygame.event.wait().type != MUSIC_END_EVENT:
+            pass
+    else:
+        while pygame.mixer.music.get_busy():
+            pygame.time.wait(100)
+
 
 def show_available_languages():
     """
     Display all available languages supported by gTTS
     """
     print("\n=== Available Languages ===")
-    langs = tts_langs()
+    langs = get_languages()
     for code, name in sorted(langs.items()):
         print(f"{code}: {name}")
     print(f"\nTotal languages supported: {len(langs)}")
     print("=" * 50)
 
 
+def stream_speech(text, lang='en'):
+    """
+    Yield the MP3 audio for text part by part, as soon as each part is ready
+
+    gTTS splits long text into parts and synthesizes them one after another.
+    A background thread keeps synthesizing while earlier parts are consumed,
+    and the complete audio is cached on disk once the last part arrives.
+
+    Args:
+        text (str): Text to be synthesized
+        lang (str): Language code (default: 'en' for English)
+
+    Yields:
+        bytes: MP3 encoded speech audio, one part at a time
+    """
+    # Cache files are keyed by a hash of the language and the text
+    key = hashlib.blake2b(f"{lang}\x00{text}".encode(), digest_size=16).hexdigest()
+    cache_path = CACHE_DIR / f"{key}.mp3"
+
+    if cache_path.exists():
+        yield cache_path.read_bytes()
+        return
+
+    # Synthesize in a background thread; None marks the end of the audio
+    parts_queue = queue.Queue()
+
+    def produce_parts():
+        try:
+            for part in gTTS(text=text, lang=lang, slow=False).stream():
+                parts_queue.put(part)
+        except Exception as e:
+            parts_queue.put(e)
+        else:
+            parts_queue.put(None)
+
+    threading.Thread(target=produce_parts, daemon=True).start()
+
+    parts = []
+    while True:
+        part = parts_queue.get()
+        if part is None:
+            break
+        if isinstance(part, Exception):
+            raise part
+        parts.append(part)
+        yield part
+
+    # Store the audio for next time; a failing cache should not stop playback
+    try:
+        # Write to a temporary file first so an interrupted write leaves no broken entry
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix('.tmp')
+        temp_path.write_bytes(b''.join(parts))
+        temp_path.replace(cache_path)
+    except OSError as e:
+        print(f"Could not cache speech audio: {e}")
+
+
+def synthesize_speech(text, lang='en'):
+    """
+    Get the complete MP3 audio for text, using the on-disk cache when possible
+
+    Args:
+        text (str): Text to be synthesized
+        lang (str): Language code (default: 'en' for English)
+
+    Returns:
+        bytes: MP3 encoded speech audio
+    """
+    return b''.join(stream_speech(text, lang))
+
+
+def load_sound(text, lang='en'):
+    """
+    Get the speech for text as a decoded pygame Sound, decoding only once
+
+    A Sound holds raw PCM samples, so replaying it needs no MP3 decoding.
+    MP3 support in pygame.mixer.Sound requires pygame 2.
+
+    Args:
+        text (str): Text to be synthesized
+        lang (str): Language code (default: 'en' for English)
+
+    Returns:
+        pygame.mixer.Sound: Decoded speech audio
+    """
+    key = (lang, text)
+    sound = _SOUND_CACHE.get(key)
+    if sound is None:
+        sound = pygame.mixer.Sound(io.BytesIO(synthesize_speech(text, lang)))
+        _SOUND_CACHE[key] = sound
+    return sound
+
+
 def speak_with_gtts(text, lang='en'):
     """
     Convert text to speech using Google Text-to-Speech
@@ -40,30 +213,16 @@ def speak_with_gtts(text, lang='en'):
         print(f"Speaking in {lang}: '{text}'")
 
         # Validate language code
-        available_langs = tts_langs()
+        available_langs = get_languages()
         if lang not in available_langs:
             print(f"Language '{lang}' not supported!")
             print("Use 'languages' command to see available languages")
             return False
 
-        # Create gTTS object
-        tts = gTTS(text=text, lang=lang, slow=False)
-
-        # Save to BytesIO object (in-memory file)
-        fp = io.BytesIO()
-        tts.write_to_fp(fp)
-        fp.seek(0)  # Reset file pointer to beginning
-
-        # Initialize pygame mixer for audio playback
-        pygame.mixer.init()
-
-        # Load and play the audio
-        pygame.mixer.music.load(fp)
-        pygame.mixer.music.play()
-
-        # Wait for playback to finish
-        while pygame.mixer.music.get_busy():
-            pygame.time.Clock().tick(10)
+        # Play each part as soon as it arrives from the cache or from Google,
+        # so long texts start speaking before the whole text is synthesized
+        for part in stream_speech(text, lang):
+            play_audio(io.BytesIO(part))
 
         print("Speech completed!")
 
@@ -167,10 +326,33 @@ def multilingual_demo():
     print("=== Multilingual Demo ===")
     print("Playing examples in different languages...")
 
-    for lang, text in examples:
-        print(f"\n{lang.upper()}: {text}")
-        input("Press Enter to hear this language...")
-        speak_with_gtts(text, lang)
+    # The mixer must be open before sounds can be decoded
+    init_audio()
+
+    # Synthesize and decode every example in the background while earlier
+    # ones play; sounds decoded in a previous run come from the cache
+    executor = ThreadPoolExecutor(max_workers=4)
+    try:
+        sounds = [executor.submit(load_sound, text, lang) for lang, text in examples]
+
+        for (lang, text), sound in zip(examples, sounds):
+            print(f"\n{lang.upper()}: {text}")
+            input("Press Enter to hear this language...")
+
+            try:
+                print(f"Speaking in {lang}: '{text}'")
+                decoded = sound.result()
+                decoded.play()
+                pygame.time.wait(int(decoded.get_length() * 1000))
+                print("Speech completed!")
+            except Exception as e:
+                print(f"Error during speech synthesis: {e}")
+    except KeyboardInterrupt:
+        print("\nDemo interrupted by user. Goodbye!")
+        return
+    finally:
+        # Drop the phrases not yet synthesized instead of waiting for them
+        executor.shutdown(wait=False, cancel_futures=True)
 
     print("\nDemo completed!")
 
@@ -8,6 +8,9 @@
 
 # Import required libraries
 import matplotlib.pyplot as plt  # For creating and displaying the pie chart
+import numpy as np  # For computing the wedge angles in one vectorized step
+from matplotlib.collections import PatchCollection  # For drawing all wedges at once
+from matplotlib.patches import Wedge  # For the pie slices
 
 # ============================================================================
 # DATA CONFIGURATION
@@ -15,8 +18,9 @@ import matplotlib.pyplot as plt  # For creating and displaying the pie chart
 # Define labels and sizes for the pie chart
 labels = ["Python", "C++", "Java", "C", "C#", "JavaScript", "SQL", "Go", "Delphi", "Visual Basic"]
 sizes = [23.8, 11.37, 10.66, 9.84, 4.12, 3.78, 2.87, 2.26, 2.18, 2.04]
-# Calculate the total sum of sizes for accurate percentage calculation
-total = sum(sizes)  # ~72.9, used to scale percentages
+# Precompute each slice label with its original percentage
+# (the sizes already are percentages, so no per-wedge rescaling is needed)
+pct_labels = [f"{label}\n{size:.1f}%" for label, size in zip(labels, sizes)]
 
 # ============================================================================
 # PLOT SETUP
@@ -31,20 +35,30 @@ plt.title("Top 10 Programming Languages Popularity \n"
 # ============================================================================
 # PIE CHART CREATION
 # ============================================================================
-# Create the pie chart with specified parameters
-# labels: Programming language names
-# autopct: Custom function to scale normalized percentages back to original
-# counterclock=False: Arrange slices clockwise
-# shadow=True: Add shadow effect for visual depth
-# startangle=90: Rotate chart to start at 90 degrees
-# colors: Use tab10 colormap for distinct colors
-plt.pie(sizes, 
-        labels=labels, 
-        autopct=lambda p: f'{p * total / 100:.1f}%',  # Scale normalized percentages
-        counterclock=False, 
-        shadow=True, 
-        startangle=90, 
-        colors=plt.cm.tab10(range(10)))  # Use tab10 colormap for colors
+# Build the pie from Wedge patches drawn as a single PatchCollection,
+# which the backend renders in one call instead of one artist per slice
+ax = plt.gca()
+
+# Wedge boundaries in degrees: start at 90 degrees and run clockwise,
+# each slice spanning its share of the full circle
+boundaries = 90 - 360 * np.concatenate(([0], np.cumsum(sizes))) / np.sum(sizes)
+wedges = [Wedge((0, 0), 1, end, start) for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+# Slices: use tab10 colormap for distinct colors
+# (read straight from its color list, skipping the colormap lookup)
+colors = plt.cm.tab10.colors[:len(labels)]
+ax.add_collection(PatchCollection(wedges, facecolors=colors, linewidth=0))
+
+# Labels: placed just outside each slice at its middle angle
+mid_angles = np.deg2rad((boundaries[:-1] + boundaries[1:]) / 2)
+for label, x, y in zip(pct_labels, 1.1 * np.cos(mid_angles), 1.1 * np.sin(mid_angles)):
+    ax.text(x, y, label, ha='left' if x > 0 else 'right', va='center')
+
+# Keep the pie circular and hide the axes, as plt.pie does
+ax.set_aspect('equal')
+ax.set_xlim(-1.25, 1.25)
+ax.set_ylim(-1.25, 1.25)
+ax.axis('off')
 
 # ============================================================================
 # DISPLAY OUTPUT
@@ -8,13 +8,16 @@
 
 # Import required libraries
 import matplotlib.pyplot as plt  # For creating and displaying the bar graph
+import numpy as np  # For storing the data as compact arrays
 
 # ============================================================================
 # DATA CONFIGURATION
 # ============================================================================
 # Define labels and sizes for the bar graph
-labels = ["Python", "C++", "Java", "C", "C#", "JavaScript", "SQL", "Go", "Delphi", "Visual Basic"]
-sizes = [23.8, 11.37, 10.66, 9.84, 4.12, 3.78, 2.87, 2.26, 2.18, 2.04]
+# Stored as NumPy arrays; float32 only shrinks this stored copy, since
+# matplotlib converts bar heights to float64 when it builds the bars
+labels = np.asarray(["Python", "C++", "Java", "C", "C#", "JavaScript", "SQL", "Go", "Delphi", "Visual Basic"])
+sizes = np.asarray([23.8, 11.37, 10.66, 9.84, 4.12, 3.78, 2.87, 2.26, 2.18, 2.04], dtype=np.float32)
 
 # ============================================================================
 # PLOT SETUP
@@ -23,16 +26,20 @@ sizes = [23.8, 11.37, 10.66, 9.84, 4.12, 3.78, 2.87, 2.26, 2.18, 2.04]
 plt.figure(num="Programming Languages Popularity (2025)")
 
 # Use the 'tab10' colormap to generate distinct colors for each bar
-colors = plt.cm.tab10(range(len(labels)))
+# tab10 is a ListedColormap, so its colors can be read directly
+colors = list(plt.cm.tab10.colors[:len(labels)])
 
 # ============================================================================
 # BAR GRAPH CREATION
 # ============================================================================
 # Create the bar graph with specified parameters
-# labels: Programming language names for x-axis
+# xs: Numeric bar positions (avoids matplotlib's string-to-category conversion)
 # sizes: Popularity percentages for bar heights
 # color: Assign distinct colors from tab10 colormap
-plt.bar(labels, sizes, color=colors)
+xs = np.arange(len(labels))
+plt.bar(xs, sizes, color=colors)
+# Label each bar position with its programming language name
+plt.xticks(xs, labels)
 
 # Add axis labels and title for clarity
 plt.xlabel("Programming Languages")
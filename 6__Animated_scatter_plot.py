@@ -7,6 +7,22 @@
 # ============================================================================
 
 # Import required libraries
+import matplotlib  # For selecting the rendering backend
+
+# Set to True to render with the mplcairo Qt backend (pip install mplcairo):
+# it stamps each scatter marker with a single cairo mask instead of
+# rasterizing every marker path. Off by default, so the backend chosen via
+# MPLBACKEND or matplotlibrc (or matplotlib's own fallback) is respected.
+USE_MPLCAIRO = False
+
+# The backend must be chosen before pyplot is imported
+if USE_MPLCAIRO:
+    try:
+        import mplcairo.qt  # noqa: F401
+        matplotlib.use('module://mplcairo.qt')
+    except ImportError:
+        print("mplcairo or its Qt binding is not installed; using the default backend")
+
 import matplotlib.pyplot as plt  # For creating static and animated plots
 import matplotlib.animation as animation  # For creating animations
 import numpy as np  # For numerical operations and random data generation
@@ -16,12 +32,23 @@ import numpy as np  # For numerical operations and random data generation
 # ============================================================================
 # Define constants and generate initial random data for the scatter plot
 num_points = 200  # Number of points to display in the scatter plot
+seed = 0  # Random seed, so every run starts from the same points
+# Seeded PCG64 generator that fills existing arrays without allocating
+rng = np.random.default_rng(seed)
 # Generate random x and y coordinates (range 0-10) for 'num_points' points
-x, y = np.random.rand(2, num_points) * 10
+# Stored as one (num_points, 2) array, the layout matplotlib expects for offsets
+pts = np.empty((num_points, 2))
+rng.random(out=pts)
+pts *= 10
 # Generate random colors for each point (values between 0 and 1)
-colors = np.random.rand(num_points)
+colors = rng.random(num_points)
+# Map the colors to RGBA once, so drawing never goes through the colormap
+rgba = plt.cm.viridis(colors)
 # Generate random sizes for each point (scaled to 0-1000 for visibility)
-sizes = np.random.rand(num_points) * 1000
+sizes = rng.random(num_points) * 1000
+
+# Per-frame buffer, allocated once and reused by every animation frame
+steps = np.empty_like(pts)  # Random movement applied each frame
 
 # ============================================================================
 # PLOT SETUP
@@ -29,7 +56,8 @@ sizes = np.random.rand(num_points) * 1000
 # Create a figure and axis for the scatter plot
 fig, ax = plt.subplots()  # fig: figure object, ax: axes object for plotting
 # Create initial scatter plot with random points, colors, and sizes
-scat = ax.scatter(x, y, c=colors, s=sizes)
+# Passing RGBA values leaves the collection without a color array to remap
+scat = ax.scatter(pts[:, 0], pts[:, 1], c=rgba, s=sizes)
 # Set x and y axis limits to ensure points stay within view
 ax.set_xlim(0, 10)
 ax.set_ylim(0, 10)
@@ -47,10 +75,18 @@ def animate(i):
     Returns:
         scat: Updated scatter plot object
     """
-    # Update point positions by adding small random offsets to x and y
-    # np.c_ combines x and y into a 2D array of shape (num_points, 2)
-    # Random offsets (0 to 0.1) add subtle movement to each point
-    scat.set_offsets(np.c_[x + np.random.rand(num_points) * 0.1, y + np.random.rand(num_points) * 0.1])
+    # Move the points by adding small random steps to their positions
+    # One RNG call fills both columns in place; no temporary arrays are created
+    # Random steps (-0.1 to 0.1) are zero-mean, so the walk has no drift;
+    # positions are then clipped to the 0-10 axis limits, so no point ever
+    # leaves the view (where it would still cost rendering time)
+    # (ufuncs with out= update the module-level arrays without rebinding them)
+    rng.random(out=steps)
+    np.subtract(steps, 0.5, out=steps)
+    np.multiply(steps, 0.2, out=steps)
+    np.add(pts, steps, out=pts)
+    np.clip(pts, 0, 10, out=pts)
+    scat.set_offsets(pts)
     return scat,  # Return the updated scatter object (required for animation)
 
 # ============================================================================
@@ -60,7 +96,12 @@ def animate(i):
 # FuncAnimation calls 'animate' for each frame, updating the plot
 # frames=100: total number of frames in the animation
 # interval=50: delay between frames in milliseconds (50ms = 20 frames/second)
-ani = animation.FuncAnimation(fig, animate, frames=100, interval=50)
+# blit=True: only redraw the artists returned by 'animate'; the static axes
+# are cached as a background image (the fixed axis limits keep it valid)
+# cache_frame_data=False: 'animate' updates the same scatter object in place,
+# so keeping every frame's return value would only hold on to memory
+ani = animation.FuncAnimation(fig, animate, frames=100, interval=50, blit=True,
+                              cache_frame_data=False)
 
 # ============================================================================
 # DISPLAY OUTPUT
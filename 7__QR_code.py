@@ -3,19 +3,30 @@
 #
 # Description: This script creates a QR code from user-provided data (filename or URL) 
 # and saves it as a PNG image with a random RGB background color. The QR code is 
-# displayed upon generation.
+# displayed upon generation. Set OUTPUT_FORMAT to 'svg' to save a scalable SVG
+# instead, which is built from a few KB of path data rather than rasterized pixels.
 #
 # Dependencies: 
 #   - qrcode: Library for generating QR codes
-#   - random: Library for generating random numbers
+#   - numpy: Library for building the image pixels in vectorized form
+#   - Pillow (PIL): Library for saving and displaying the image
+#   - os: Library for generating random bytes
+#   - concurrent.futures: Library for saving the PNG in a background thread
 #
 # Usage: Run the script, input a filename or data string when prompted, and the script 
 # will generate and save a QR code as a PNG file with the provided name.
 #
 ##########################################################################################
 
+import numpy as np
+import os
+from concurrent.futures import ThreadPoolExecutor
 import qrcode
-import random
+from PIL import Image
+from qrcode.image.svg import SvgPathImage
+
+# Output format: 'png' (rasterized, displayed after saving) or 'svg' (scale-free)
+OUTPUT_FORMAT = 'png'
 
 # Prompt user for input data (e.g., filename or URL to encode in the QR code)
 data = input("Enter the name of the file to save a QR code:  ")
@@ -25,10 +36,11 @@ data = input("Enter the name of the file to save a QR code:  ")
 # - error_correction=ERROR_CORRECT_L: Low error correction level (~7% data recovery)
 # - box_size=10: Size of each QR code module (pixels)
 # - border=4: Border thickness around the QR code (in modules)
+box_size = 10
 qr = qrcode.QRCode(
     version=1,
     error_correction=qrcode.constants.ERROR_CORRECT_L,
-    box_size=10,
+    box_size=box_size,
     border=4,
 )
 
@@ -38,20 +50,49 @@ qr.add_data(data)
 qr.make(fit=True)
 
 # Generate a random RGB color tuple for the background
-random_color = (random.randint(0, 255), random.randint(0, 255), random.randint(0, 255))
+# Three random bytes give a uniform 0-255 value per channel in a single call
+random_color = tuple(os.urandom(3))
+
+if OUTPUT_FORMAT == 'svg':
+    # Create the QR code as a single SVG path with a random background color
+    # (the background is read when the image is created, hence the subclass)
+    class BackgroundSvgPathImage(SvgPathImage):
+        background = f"rgb{random_color}"
+
+    img = qr.make_image(image_factory=BackgroundSvgPathImage)
+
+    # Save the generated QR code as an SVG file using the user-provided filename
+    img.save(f"{data}.svg")
+    print(f"QR code saved as: {data}.svg")
+else:
+    # Create the QR code image with black foreground and random background color
+    # The module matrix (border included) is scaled up to box_size pixels per
+    # module in a single vectorized step, without per-module drawing
+    modules = np.array(qr.get_matrix(), dtype=bool)
+    modules = modules.repeat(box_size, axis=0).repeat(box_size, axis=1)
 
-# Create the QR code image with black foreground and random background color
-img = qr.make_image(fill_color='black', back_color=random_color)
+    # The booleans are reused as one-byte palette indices (no RGB pixel buffer):
+    # index 0 is the random background color and index 1 is black
+    img = Image.fromarray(modules.view(np.uint8))
+    img.putpalette((*random_color, 0, 0, 0))
 
-# Save the generated QR code as a PNG file using the user-provided filename
-img.save(f"{data}.png")
-# Display the generated QR code image
-img.show()
+    # Save the generated QR code as a PNG file using the user-provided filename
+    # The save runs in a background thread (zlib releases the GIL while
+    # compressing), so the image viewer starts without waiting for it
+    # The thread saves its own copy: img.show() also calls img.save, and two
+    # saves of one Image object overwrite each other's encoder settings
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        saved = executor.submit(img.copy().save, f"{data}.png")
+        # Display the generated QR code image
+        img.show()
+        saved.result()  # Re-raise any error from saving the file
 
 ##########################################################################################
 # Notes:
-# - Ensure the 'qrcode' and 'Pillow' (PIL) libraries are installed (`pip install qrcode pillow`).
-# - The generated QR code is saved as '[data].png' in the current working directory.
+# - Ensure the 'qrcode', 'numpy' and 'Pillow' (PIL) libraries are installed
+#   (`pip install qrcode numpy pillow`).
+# - The generated QR code is saved as '[data].png' (or '[data].svg') in the current
+#   working directory.
 # - The random background color is an RGB tuple with values between 0 and 255 for each channel.
 # - The QR code uses low error correction (ERROR_CORRECT_L) for simplicity; other options 
 #   include ERROR_CORRECT_M, ERROR_CORRECT_Q, or ERROR_CORRECT_H for higher correction levels.
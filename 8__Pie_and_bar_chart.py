@@ -0,0 +1,90 @@
+# ============================================================================
+# PROGRAMMING LANGUAGES POPULARITY PIE CHART AND BAR GRAPH
+# ============================================================================
+# A script to show the pie chart and the bar graph of programming language
+# popularity in 2025 (index.dev, February 2025) side by side in one figure.
+# Sharing one figure initializes pyplot, the backend, and the colors once
+# instead of once per script.
+# ============================================================================
+
+# Import required libraries
+import matplotlib.pyplot as plt  # For creating and displaying the charts
+import numpy as np  # For computing the wedge angles in one vectorized step
+from matplotlib.collections import PatchCollection  # For drawing all wedges at once
+from matplotlib.patches import Wedge  # For the pie slices
+
+# ============================================================================
+# DATA CONFIGURATION
+# ============================================================================
+# Define labels and sizes shared by both charts
+# Kept as NumPy arrays so the pie's vectorized angle math and the bar graph
+# read the same data (matplotlib draws in float64 whatever dtype is stored)
+labels = np.asarray(["Python", "C++", "Java", "C", "C#", "JavaScript", "SQL", "Go", "Delphi", "Visual Basic"])
+sizes = np.asarray([23.8, 11.37, 10.66, 9.84, 4.12, 3.78, 2.87, 2.26, 2.18, 2.04], dtype=np.float32)
+# Precompute each slice label with its original percentage
+# (the sizes already are percentages, so no per-wedge rescaling is needed)
+pct_labels = [f"{label}\n{size:.1f}%" for label, size in zip(labels, sizes)]
+
+# ============================================================================
+# PLOT SETUP
+# ============================================================================
+# Create one figure with two subplots and set the window title
+fig, (ax1, ax2) = plt.subplots(1, 2, num="Programming Languages Popularity (2025)",
+                               figsize=(14, 6))
+
+# Add a shared title (caption) to the figure
+fig.suptitle("Top 10 Programming Languages Popularity\n"
+             "According to index.dev in February 2025")
+
+# Use the 'tab10' colormap for both charts, read directly from its color list
+colors = list(plt.cm.tab10.colors[:len(labels)])
+
+# ============================================================================
+# PIE CHART CREATION
+# ============================================================================
+# Build the pie from Wedge patches drawn as a single PatchCollection,
+# which the backend renders in one call instead of one artist per slice
+
+# Wedge boundaries in degrees: start at 90 degrees and run clockwise,
+# each slice spanning its share of the full circle
+boundaries = 90 - 360 * np.concatenate(([0], np.cumsum(sizes))) / np.sum(sizes)
+wedges = [Wedge((0, 0), 1, end, start) for start, end in zip(boundaries[:-1], boundaries[1:])]
+
+# Slices: one color per language
+ax1.add_collection(PatchCollection(wedges, facecolors=colors, linewidth=0))
+
+# Labels: placed just outside each slice at its middle angle
+mid_angles = np.deg2rad((boundaries[:-1] + boundaries[1:]) / 2)
+for label, x, y in zip(pct_labels, 1.1 * np.cos(mid_angles), 1.1 * np.sin(mid_angles)):
+    ax1.text(x, y, label, ha='left' if x > 0 else 'right', va='center')
+
+# Keep the pie circular and hide the axes, as plt.pie does
+ax1.set_aspect('equal')
+ax1.set_xlim(-1.25, 1.25)
+ax1.set_ylim(-1.25, 1.25)
+ax1.axis('off')
+
+# ============================================================================
+# BAR GRAPH CREATION
+# ============================================================================
+# Create the bar graph with specified parameters
+# xs: Numeric bar positions (avoids matplotlib's string-to-category conversion)
+# sizes: Popularity percentages for bar heights
+# color: Same colors as the pie slices
+xs = np.arange(len(labels))
+ax2.bar(xs, sizes, color=colors)
+# Label each bar position with its programming language name
+ax2.set_xticks(xs)
+ax2.set_xticklabels(labels)
+
+# Add axis labels for clarity
+ax2.set_xlabel("Programming Languages")
+ax2.set_ylabel("Popularity (%)")
+ax2.tick_params(axis='x', rotation=45)
+
+# ============================================================================
+# DISPLAY OUTPUT
+# ============================================================================
+# Display both charts
+fig.tight_layout()
+plt.show()